@@ -1,12 +1,17 @@
 # Advanced Dash App - Multi-Page Dashboard with Real-Time Updates
+import functools
 import dash
 from dash import dcc, html, Input, Output, State
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+# Serialize figures with the orjson C extension instead of the stdlib json module
+pio.json.config.default_engine = 'orjson'
+
 # Initialize the app with custom styling
 app = dash.Dash(__name__)
 
@@ -19,6 +24,28 @@ df_sales = pd.DataFrame({
     'Revenue': np.random.normal(5000, 1000, len(dates)),
     'Region': np.random.choice(['North', 'South', 'East', 'West'], len(dates))
 })
+# Categorical regions let groupby/box plots work on integer codes
+df_sales['Region'] = pd.Categorical(df_sales['Region'],
+                                    categories=['East', 'North', 'South', 'West'])
+
+# KPI aggregates, computed once since the sample data never changes
+TOTAL_SALES = df_sales['Sales'].to_numpy().sum()
+TOTAL_REVENUE = df_sales['Revenue'].to_numpy().sum()
+AVG_REVENUE = df_sales['Revenue'].to_numpy().mean()
+REGIONAL_DF = df_sales.groupby('Region', observed=True)[['Sales', 'Revenue']].sum().reset_index()
+
+# Chart palettes
+_SET2 = px.colors.qualitative.Set2
+_VIRIDIS = 'Viridis'
+
+# Live graph layout never changes, so it is serialized once up front
+_LIVE_LAYOUT = go.Layout(
+    title='Live Sales Updates',
+    xaxis_title='Time Interval',
+    yaxis_title='Sales Count',
+    height=400,
+    template=pio.templates[pio.templates.default]
+).to_plotly_json()
 
 # Product data
 products = pd.DataFrame({
@@ -65,127 +92,175 @@ app.layout = html.Div([
 
         html.Div([
             html.Div(id='live-sales', style={'fontSize': '24px', 'fontWeight': 'bold', 'color': '#27ae60'}),
-            dcc.Graph(id='live-graph')
+            dcc.Graph(id='live-graph', figure={'data': [], 'layout': _LIVE_LAYOUT})
         ], style={'textAlign': 'center', 'marginTop': '20px'})
     ], style={'backgroundColor': '#ecf0f1', 'padding': '20px', 'margin': '20px', 'borderRadius': '10px'})
 
 ], style={'fontFamily': 'Arial, sans-serif'})
 
 
+# Static tab figures, built once at import and handed to Dash as plain dicts
+_TAB1_LINE = (px.line(df_sales, x='Date', y='Sales',
+                      title='Sales Trend Over Time')
+              .update_traces(line_color='#3498db', line_width=3)
+              .to_plotly_json())
+
+_TAB2_BAR = (px.bar(products, x='Product', y='Sales', color='Category',
+                    title='Sales by Product',
+                    color_discrete_sequence=_SET2)
+             .update_layout(showlegend=True)
+             .to_plotly_json())
+
+_TAB2_PIE = px.pie(products, values='Profit', names='Product',
+                   title='Profit Distribution by Product',
+                   hole=0.4).to_plotly_json()
+
+_TAB2_SCATTER = px.scatter(products, x='Sales', y='Profit', size='Profit',
+                           color='Category', hover_name='Product',
+                           title='Sales vs Profit Analysis',
+                           size_max=60).to_plotly_json()
+
+_TAB3_BAR = px.bar(REGIONAL_DF, x='Region', y='Sales',
+                   title='Sales by Region',
+                   color='Sales',
+                   color_continuous_scale=_VIRIDIS).to_plotly_json()
+
+_TAB3_PIE = go.Figure(data=[go.Pie(
+    labels=REGIONAL_DF['Region'],
+    values=REGIONAL_DF['Revenue'],
+    pull=[0.1, 0, 0, 0]
+)]).update_layout(title='Revenue Distribution by Region').to_plotly_json()
+
+_TAB3_BOX = px.box(df_sales, x='Region', y='Sales',
+                   title='Sales Distribution by Region',
+                   color='Region').to_plotly_json()
+
+
+# Tab content only depends on the static sample data, so each tab is
+# built once and reused on later tab switches
+def _build_tab1():
+    # Sales Overview Tab
+    return html.Div([
+        html.Div([
+            html.Div([
+                html.H3('Total Sales', style={'color': '#3498db'}),
+                html.H2(f'{TOTAL_SALES:,.0f}', style={'color': '#2c3e50'})
+            ], style={'backgroundColor': 'white', 'padding': '20px', 'borderRadius': '10px',
+                     'boxShadow': '2px 2px 10px rgba(0,0,0,0.1)', 'flex': '1', 'margin': '10px'}),
+
+            html.Div([
+                html.H3('Avg Revenue', style={'color': '#e74c3c'}),
+                html.H2(f'${AVG_REVENUE:,.0f}', style={'color': '#2c3e50'})
+            ], style={'backgroundColor': 'white', 'padding': '20px', 'borderRadius': '10px',
+                     'boxShadow': '2px 2px 10px rgba(0,0,0,0.1)', 'flex': '1', 'margin': '10px'}),
+
+            html.Div([
+                html.H3('Total Revenue', style={'color': '#27ae60'}),
+                html.H2(f'${TOTAL_REVENUE:,.0f}', style={'color': '#2c3e50'})
+            ], style={'backgroundColor': 'white', 'padding': '20px', 'borderRadius': '10px',
+                     'boxShadow': '2px 2px 10px rgba(0,0,0,0.1)', 'flex': '1', 'margin': '10px'}),
+        ], style={'display': 'flex', 'justifyContent': 'space-around'}),
+
+        html.Div([
+            dcc.Graph(
+                figure=_TAB1_LINE
+            )
+        ], style={'marginTop': '20px'}),
+
+        html.Div([
+            html.Label('Select Date Range:', style={'fontSize': '18px', 'fontWeight': 'bold'}),
+            dcc.DatePickerRange(
+                id='date-picker-range',
+                start_date=df_sales['Date'].min(),
+                end_date=df_sales['Date'].max(),
+                display_format='YYYY-MM-DD'
+            ),
+            dcc.Graph(id='filtered-sales-graph')
+        ], style={'marginTop': '20px'})
+    ])
+
+
+def _build_tab2():
+    # Product Analysis Tab
+    return html.Div([
+        html.Div([
+            dcc.Graph(
+                figure=_TAB2_BAR
+            )
+        ], style={'width': '48%', 'display': 'inline-block'}),
+
+        html.Div([
+            dcc.Graph(
+                figure=_TAB2_PIE
+            )
+        ], style={'width': '48%', 'display': 'inline-block', 'float': 'right'}),
+
+        html.Div([
+            dcc.Graph(
+                figure=_TAB2_SCATTER
+            )
+        ], style={'marginTop': '20px'})
+    ])
+
+
+def _build_tab3():
+    # Regional Insights Tab
+    return html.Div([
+        html.Div([
+            dcc.Graph(
+                figure=_TAB3_BAR
+            )
+        ], style={'width': '48%', 'display': 'inline-block'}),
+
+        html.Div([
+            dcc.Graph(
+                figure=_TAB3_PIE
+            )
+        ], style={'width': '48%', 'display': 'inline-block', 'float': 'right'}),
+
+        html.Div([
+            dcc.Graph(
+                figure=_TAB3_BOX
+            )
+        ], style={'marginTop': '20px'})
+    ])
+
+
+_TAB_BUILDERS = {
+    'tab-1': _build_tab1,
+    'tab-2': _build_tab2,
+    'tab-3': _build_tab3,
+}
+_TAB_CACHE = {}
+
+
 # Callback for tab content
 @app.callback(
     Output('tabs-content', 'children'),
     Input('tabs', 'value')
 )
 def render_content(tab):
-    if tab == 'tab-1':
-        # Sales Overview Tab
-        return html.Div([
-            html.Div([
-                html.Div([
-                    html.H3('Total Sales', style={'color': '#3498db'}),
-                    html.H2(f'{df_sales["Sales"].sum():,.0f}', style={'color': '#2c3e50'})
-                ], style={'backgroundColor': 'white', 'padding': '20px', 'borderRadius': '10px',
-                         'boxShadow': '2px 2px 10px rgba(0,0,0,0.1)', 'flex': '1', 'margin': '10px'}),
-
-                html.Div([
-                    html.H3('Avg Revenue', style={'color': '#e74c3c'}),
-                    html.H2(f'${df_sales["Revenue"].mean():,.0f}', style={'color': '#2c3e50'})
-                ], style={'backgroundColor': 'white', 'padding': '20px', 'borderRadius': '10px',
-                         'boxShadow': '2px 2px 10px rgba(0,0,0,0.1)', 'flex': '1', 'margin': '10px'}),
-
-                html.Div([
-                    html.H3('Total Revenue', style={'color': '#27ae60'}),
-                    html.H2(f'${df_sales["Revenue"].sum():,.0f}', style={'color': '#2c3e50'})
-                ], style={'backgroundColor': 'white', 'padding': '20px', 'borderRadius': '10px',
-                         'boxShadow': '2px 2px 10px rgba(0,0,0,0.1)', 'flex': '1', 'margin': '10px'}),
-            ], style={'display': 'flex', 'justifyContent': 'space-around'}),
-
-            html.Div([
-                dcc.Graph(
-                    figure=px.line(df_sales, x='Date', y='Sales',
-                                  title='Sales Trend Over Time')
-                        .update_traces(line_color='#3498db', line_width=3)
-                )
-            ], style={'marginTop': '20px'}),
+    if tab not in _TAB_CACHE:
+        builder = _TAB_BUILDERS.get(tab)
+        if builder is None:
+            return None
+        _TAB_CACHE[tab] = builder()
+    return _TAB_CACHE[tab]
 
-            html.Div([
-                html.Label('Select Date Range:', style={'fontSize': '18px', 'fontWeight': 'bold'}),
-                dcc.DatePickerRange(
-                    id='date-picker-range',
-                    start_date=df_sales['Date'].min(),
-                    end_date=df_sales['Date'].max(),
-                    display_format='YYYY-MM-DD'
-                ),
-                dcc.Graph(id='filtered-sales-graph')
-            ], style={'marginTop': '20px'})
-        ])
-
-    elif tab == 'tab-2':
-        # Product Analysis Tab
-        return html.Div([
-            html.Div([
-                dcc.Graph(
-                    figure=px.bar(products, x='Product', y='Sales', color='Category',
-                                 title='Sales by Product',
-                                 color_discrete_sequence=px.colors.qualitative.Set2)
-                        .update_layout(showlegend=True)
-                )
-            ], style={'width': '48%', 'display': 'inline-block'}),
 
-            html.Div([
-                dcc.Graph(
-                    figure=px.pie(products, values='Profit', names='Product',
-                                 title='Profit Distribution by Product',
-                                 hole=0.4)
-                )
-            ], style={'width': '48%', 'display': 'inline-block', 'float': 'right'}),
+# Dates are sorted, so date ranges can be found by binary search
+_DATES_NS = df_sales['Date'].to_numpy(dtype='datetime64[ns]')
 
-            html.Div([
-                dcc.Graph(
-                    figure=px.scatter(products, x='Sales', y='Profit', size='Profit',
-                                     color='Category', hover_name='Product',
-                                     title='Sales vs Profit Analysis',
-                                     size_max=60)
-                )
-            ], style={'marginTop': '20px'})
-        ])
-
-    elif tab == 'tab-3':
-        # Regional Insights Tab
-        regional_data = df_sales.groupby('Region').agg({
-            'Sales': 'sum',
-            'Revenue': 'sum'
-        }).reset_index()
-
-        return html.Div([
-            html.Div([
-                dcc.Graph(
-                    figure=px.bar(regional_data, x='Region', y='Sales',
-                                 title='Sales by Region',
-                                 color='Sales',
-                                 color_continuous_scale='Viridis')
-                )
-            ], style={'width': '48%', 'display': 'inline-block'}),
 
-            html.Div([
-                dcc.Graph(
-                    figure=go.Figure(data=[go.Pie(
-                        labels=regional_data['Region'],
-                        values=regional_data['Revenue'],
-                        pull=[0.1, 0, 0, 0]
-                    )]).update_layout(title='Revenue Distribution by Region')
-                )
-            ], style={'width': '48%', 'display': 'inline-block', 'float': 'right'}),
-
-            html.Div([
-                dcc.Graph(
-                    figure=px.box(df_sales, x='Region', y='Sales',
-                                 title='Sales Distribution by Region',
-                                 color='Region')
-                )
-            ], style={'marginTop': '20px'})
-        ])
+@functools.lru_cache(maxsize=32)
+def _filtered_revenue_figure(start_date, end_date):
+    lo = np.searchsorted(_DATES_NS, np.datetime64(start_date, 'ns'), side='left')
+    hi = np.searchsorted(_DATES_NS, np.datetime64(end_date, 'ns'), side='right')
+    filtered_df = df_sales.iloc[lo:hi]
+    fig = px.area(filtered_df, x='Date', y='Revenue',
+                  title=f'Revenue from {start_date} to {end_date}')
+    fig.update_traces(fill='tozeroy', line_color='#e74c3c')
+    return fig
 
 
 # Callback for filtered sales graph
@@ -195,11 +270,7 @@ def render_content(tab):
     Input('date-picker-range', 'end_date')
 )
 def update_filtered_graph(start_date, end_date):
-    filtered_df = df_sales[(df_sales['Date'] >= start_date) & (df_sales['Date'] <= end_date)]
-    fig = px.area(filtered_df, x='Date', y='Revenue',
-                  title=f'Revenue from {start_date} to {end_date}')
-    fig.update_traces(fill='tozeroy', line_color='#e74c3c')
-    return fig
+    return _filtered_revenue_figure(start_date, end_date)
 
 
 # Callbacks for live updates
@@ -215,35 +286,41 @@ def toggle_interval(start_clicks, stop_clicks, disabled):
     return True
 
 
-@app.callback(
+# Live sales are simulated in the browser: each tick appends one random
+# point to a 20-point rolling window, so no request goes back to the server.
+# The layout is read from the graph's current figure.
+app.clientside_callback(
+    """
+    function(n, figure) {
+        const sales = Math.floor(Math.random() * 70) + 80;
+        const live = window._liveSales = window._liveSales || {x: [], y: []};
+        live.x.push(n);
+        live.y.push(sales);
+        if (live.x.length > 20) {
+            live.x.shift();
+            live.y.shift();
+        }
+        return [
+            'Current Sales: ' + sales + ' units',
+            {
+                data: [{
+                    type: 'scattergl',
+                    x: live.x.slice(),
+                    y: live.y.slice(),
+                    mode: 'lines+markers',
+                    line: {color: '#27ae60', width: 3},
+                    marker: {size: 8}
+                }],
+                layout: figure.layout
+            }
+        ];
+    }
+    """,
     Output('live-sales', 'children'),
     Output('live-graph', 'figure'),
-    Input('interval-component', 'n_intervals')
+    Input('interval-component', 'n_intervals'),
+    State('live-graph', 'figure')
 )
-def update_live_data(n):
-    # Simulate real-time data
-    current_sales = np.random.randint(80, 150)
-
-    # Generate last 20 data points
-    time_points = list(range(max(0, n-19), n+1))
-    sales_points = [np.random.randint(80, 150) for _ in time_points]
-
-    fig = go.Figure(data=go.Scatter(
-        x=time_points,
-        y=sales_points,
-        mode='lines+markers',
-        line=dict(color='#27ae60', width=3),
-        marker=dict(size=8)
-    ))
-
-    fig.update_layout(
-        title='Live Sales Updates',
-        xaxis_title='Time Interval',
-        yaxis_title='Sales Count',
-        height=400
-    )
-
-    return f'Current Sales: {current_sales} units', fig
 
 
 if __name__ == '__main__':
@@ -3,8 +3,12 @@ import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
 import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 
+# Serialize figures with the orjson C extension instead of the stdlib json module
+pio.json.config.default_engine = 'orjson'
+
 # Create sample data
 df = pd.DataFrame({
     'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
@@ -2,9 +2,13 @@
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import plotly.io as pio
 import numpy as np
 import pandas as pd
 
+# Serialize figures with the orjson C extension instead of the stdlib json module
+pio.json.config.default_engine = 'orjson'
+
 print("Creating advanced Plotly visualizations...\n")
 
 # Example 1: Multiple Subplots Dashboard
@@ -28,7 +32,7 @@ fig1.add_trace(go.Bar(x=categories, y=values, name='Revenue'), row=1, col=2)
 
 # Scatter plot
 np.random.seed(42)
-fig1.add_trace(go.Scatter(
+fig1.add_trace(go.Scattergl(
     x=np.random.randn(50),
     y=np.random.randn(50),
     mode='markers',
@@ -44,12 +48,17 @@ fig1.show()
 
 # Example 2: 3D Surface Plot
 print("2. Creating 3D surface plot...")
-x = np.linspace(-5, 5, 50)
-y = np.linspace(-5, 5, 50)
-X, Y = np.meshgrid(x, y)
-Z = np.sin(np.sqrt(X**2 + Y**2))
-
-fig2 = go.Figure(data=[go.Surface(z=Z, x=X, y=Y, colorscale='Viridis')])
+# float32 halves the data Plotly has to serialize and send to the browser
+x = np.linspace(-5, 5, 50, dtype=np.float32)
+y = np.linspace(-5, 5, 50, dtype=np.float32)
+# Broadcasting the axes replaces the meshgrid; hypot fuses the square/add/sqrt
+# passes and sin runs in place on the same buffer
+Z = np.hypot(x, y[:, None])
+np.sin(Z, out=Z)
+
+# The grid is regular, so the 1-D axes are enough for x/y; Plotly sends
+# contiguous arrays as base64 typed buffers ({"dtype": "f4", "bdata": ...})
+fig2 = go.Figure(data=[go.Surface(z=Z, x=x, y=y, colorscale='Viridis')])
 fig2.update_layout(
     title='3D Surface Plot: sin(√(x² + y²))',
     scene=dict(
@@ -64,19 +73,22 @@ fig2.show()
 
 # Example 3: Animated Scatter Plot
 print("3. Creating animated scatter plot...")
-# Create sample data for animation
-np.random.seed(42)
+# Create sample data for animation (all frames generated in one go)
+rng = np.random.default_rng(42)
 n_frames = 20
-df_anim = pd.DataFrame()
+n_points = 30
+frame_idx = np.arange(n_frames)
 
-for frame in range(n_frames):
-    temp_df = pd.DataFrame({
-        'x': np.random.randn(30) + frame * 0.3,
-        'y': np.random.randn(30) + frame * 0.2,
-        'size': np.random.randint(10, 50, 30),
-        'frame': frame
-    })
-    df_anim = pd.concat([df_anim, temp_df])
+x = rng.standard_normal((n_frames, n_points)) + (frame_idx * 0.3)[:, None]
+y = rng.standard_normal((n_frames, n_points)) + (frame_idx * 0.2)[:, None]
+size = rng.integers(10, 50, (n_frames, n_points))
+
+df_anim = pd.DataFrame({
+    'x': x.ravel(),
+    'y': y.ravel(),
+    'size': size.ravel(),
+    'frame': np.repeat(frame_idx, n_points)
+})
 
 fig3 = px.scatter(df_anim, x='x', y='y', animation_frame='frame',
                   size='size', color='size',
@@ -87,11 +99,14 @@ fig3.show()
 # Example 4: Advanced Stock-like Candlestick Chart
 print("4. Creating candlestick chart...")
 dates = pd.date_range('2024-01-01', periods=30, freq='D')
-np.random.seed(42)
-open_prices = 100 + np.cumsum(np.random.randn(30))
-high_prices = open_prices + np.random.uniform(1, 5, 30)
-low_prices = open_prices - np.random.uniform(1, 5, 30)
-close_prices = open_prices + np.random.randn(30) * 2
+# Draw all the random price moves in two block calls
+rng = np.random.default_rng(42)
+noise = rng.standard_normal((30, 2))
+spread = rng.uniform(1, 5, (30, 2))
+open_prices = 100 + np.cumsum(noise[:, 0])
+high_prices = open_prices + spread[:, 0]
+low_prices = open_prices - spread[:, 1]
+close_prices = open_prices + noise[:, 1] * 2
 
 fig4 = go.Figure(data=[go.Candlestick(
     x=dates,
@@ -113,16 +128,20 @@ fig4.show()
 print("5. Creating correlation heatmap...")
 # Generate correlated data
 data = np.random.randn(100, 5)
-df_corr = pd.DataFrame(data, columns=['Var A', 'Var B', 'Var C', 'Var D', 'Var E'])
-correlation_matrix = df_corr.corr()
+labels = ['Var A', 'Var B', 'Var C', 'Var D', 'Var E']
+
+# Pearson correlation as one matrix product of the standardized columns
+standardized = data - data.mean(axis=0)
+standardized /= standardized.std(axis=0, ddof=1)
+correlation_matrix = (standardized.T @ standardized) / (data.shape[0] - 1)
 
 fig5 = go.Figure(data=go.Heatmap(
-    z=correlation_matrix.values,
-    x=correlation_matrix.columns,
-    y=correlation_matrix.columns,
+    z=correlation_matrix.astype('<f4'),
+    x=labels,
+    y=labels,
     colorscale='RdBu',
     zmid=0,
-    text=correlation_matrix.values.round(2),
+    text=correlation_matrix.round(2),
     texttemplate='%{text}',
     textfont={"size": 12}
 ))
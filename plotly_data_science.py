@@ -2,9 +2,13 @@
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import plotly.io as pio
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import special
+
+# Serialize figures with the orjson C extension instead of the stdlib json module
+pio.json.config.default_engine = 'orjson'
 
 print("Creating data science visualizations...\n")
 
@@ -15,6 +19,11 @@ normal_data = np.random.normal(100, 15, 1000)
 exponential_data = np.random.exponential(2, 1000)
 uniform_data = np.random.uniform(0, 100, 1000)
 
+# float32 halves the data Plotly has to serialize and send to the browser
+normal_data = normal_data.astype(np.float32, copy=False)
+exponential_data = exponential_data.astype(np.float32, copy=False)
+uniform_data = uniform_data.astype(np.float32, copy=False)
+
 fig1 = make_subplots(
     rows=2, cols=2,
     subplot_titles=('Normal Distribution', 'Exponential Distribution',
@@ -37,7 +46,10 @@ fig1.add_trace(go.Histogram(x=uniform_data, name='Uniform', nbinsx=50,
 
 # Q-Q Plot
 sorted_data = np.sort(normal_data)
-theoretical_quantiles = stats.norm.ppf(np.linspace(0.01, 0.99, len(sorted_data)))
+# Normal quantiles via the closed form sqrt(2) * erfinv(2u - 1), which
+# vectorizes directly instead of going through stats.norm.ppf
+u = np.linspace(0.01, 0.99, len(sorted_data), dtype=np.float32)
+theoretical_quantiles = np.sqrt(np.float32(2)) * special.erfinv(2 * u - 1)
 fig1.add_trace(go.Scatter(x=theoretical_quantiles, y=sorted_data, mode='markers',
                          name='Q-Q Plot', marker_color='purple'), row=2, col=2)
 fig1.add_trace(go.Scatter(x=theoretical_quantiles, y=theoretical_quantiles,
@@ -57,6 +69,11 @@ seasonal = 10 * np.sin(2 * np.pi * time / 30)
 noise = np.random.normal(0, 2, len(time))
 ts_data = trend + seasonal + noise
 
+trend = trend.astype(np.float32, copy=False)
+seasonal = seasonal.astype(np.float32, copy=False)
+noise = noise.astype(np.float32, copy=False)
+ts_data = ts_data.astype(np.float32, copy=False)
+
 fig2 = make_subplots(
     rows=4, cols=1,
     subplot_titles=('Original Time Series', 'Trend', 'Seasonality', 'Residuals'),
@@ -101,12 +118,12 @@ fig3.show()
 print("4. Creating box plots for outlier detection...")
 # Generate data with outliers
 categories = ['Group A', 'Group B', 'Group C', 'Group D']
-data_with_outliers = []
-for i in range(4):
-    group_data = np.random.normal(50 + i*10, 10, 100)
-    # Add some outliers
-    outliers = np.random.normal(50 + i*10, 30, 5)
-    data_with_outliers.append(np.concatenate([group_data, outliers]))
+group_means = 50 + np.arange(len(categories)) * 10
+# One row per group: 100 regular values followed by 5 outliers
+data_with_outliers = np.empty((len(categories), 105), dtype=np.float32)
+data_with_outliers[:, :100] = np.random.normal(group_means[:, None], 10, (len(categories), 100))
+# Add some outliers
+data_with_outliers[:, 100:] = np.random.normal(group_means[:, None], 30, (len(categories), 5))
 
 fig4 = go.Figure()
 for i, cat in enumerate(categories):
@@ -127,18 +144,21 @@ x_reg = np.linspace(0, 10, 50)
 y_true = 2.5 * x_reg + 5
 y_noise = y_true + np.random.normal(0, 3, len(x_reg))
 
-# Fit polynomial regressions
-poly1 = np.polyfit(x_reg, y_noise, 1)
-poly3 = np.polyfit(x_reg, y_noise, 3)
+# Fit polynomial regressions from one shared Vandermonde matrix
+# (columns: x^3, x^2, x, 1 - the last two give the linear fit)
+V3 = np.vander(x_reg, 4)
+V1 = V3[:, 2:]
+poly3, *_ = np.linalg.lstsq(V3, y_noise, rcond=None)
+poly1, *_ = np.linalg.lstsq(V1, y_noise, rcond=None)
 
-y_pred1 = np.polyval(poly1, x_reg)
-y_pred3 = np.polyval(poly3, x_reg)
+y_pred1 = V1 @ poly1
+y_pred3 = V3 @ poly3
 
 fig5 = go.Figure()
 
 # Scatter plot
-fig5.add_trace(go.Scatter(x=x_reg, y=y_noise, mode='markers',
-                         name='Data Points', marker=dict(size=8, color='blue')))
+fig5.add_trace(go.Scattergl(x=x_reg, y=y_noise, mode='markers',
+                           name='Data Points', marker=dict(size=8, color='blue')))
 
 # True line
 fig5.add_trace(go.Scatter(x=x_reg, y=y_true, mode='lines',
@@ -154,12 +174,17 @@ fig5.add_trace(go.Scatter(x=x_reg, y=y_pred3, mode='lines',
                          name='Polynomial Fit (degree 3)',
                          line=dict(color='purple', width=2)))
 
-# Add residuals
-for i in range(0, len(x_reg), 3):
-    fig5.add_trace(go.Scatter(x=[x_reg[i], x_reg[i]],
-                             y=[y_noise[i], y_pred1[i]],
-                             mode='lines', line=dict(color='gray', width=1, dash='dot'),
-                             showlegend=False))
+# Add residuals as one trace, with NaN gaps between the vertical segments
+idx = np.arange(0, len(x_reg), 3)
+x_resid = np.full(idx.size * 3, np.nan)
+y_resid = np.full(idx.size * 3, np.nan)
+x_resid[0::3] = x_reg[idx]
+x_resid[1::3] = x_reg[idx]
+y_resid[0::3] = y_noise[idx]
+y_resid[1::3] = y_pred1[idx]
+fig5.add_trace(go.Scatter(x=x_resid, y=y_resid, mode='lines',
+                         line=dict(color='gray', width=1, dash='dot'),
+                         showlegend=False, connectgaps=False))
 
 fig5.update_layout(
     title='Regression Analysis with Residuals',
@@ -1,6 +1,10 @@
 # Simple Plotly Example - Interactive Chart
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
+
+# Serialize figures with the orjson C extension instead of the stdlib json module
+pio.json.config.default_engine = 'orjson'
 
 # Example 1: Simple line chart
 x_data = [1, 2, 3, 4, 5]